@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Create a runtime with ``env_vars`` and ``metadata``, then verify env in Python and shell.
+"""Create a runtime with ``env_vars`` and ``metadata``, then verify env from the shell.
 
     export GRAVIXLAYER_API_KEY=...
     python examples/runtimes/03_runtime_with_env_vars.py
@@ -31,13 +31,11 @@ print(f"Runtime ID : {runtime.runtime_id}")
 print(f"Status     : {runtime.status}")
 print(f"Metadata   : {runtime.metadata}")
 
-py = runtime.run_code(
-    code="import os; print(os.environ.get('APP_ENV', 'not set'))",
+# One shell round trip checks the remaining variables; no code kernel is started.
+sh_single = runtime.run_cmd(
+    command='echo "APP_ENV=${APP_ENV:-not set} | DATABASE_URL=${DATABASE_URL:-not set}"'
 )
-print(f"\nAPP_ENV (run_code): {py.text.strip()}")
-
-sh_single = runtime.run_cmd(command='echo "${APP_ENV:-not set}"')
-print(f"APP_ENV (single string): {sh_single.stdout.strip()}")
+print(f"\nEnv (single string)    : {sh_single.stdout.strip()}")
 
 sh_args = runtime.run_cmd(command="sh", args=["-c", 'echo "${DEBUG:-not set}"'])
 print(f"DEBUG   (command+args) : {sh_args.stdout.strip()}")
@@ -38,7 +38,7 @@ runtime.file.create_directory("/home/user/project/src")
 print("Created    : /home/user/project/src/")
 
 # ---------------------------------------------------------------------------
-# 3. Write a Python module into that directory
+# 3. Batch multipart write (multiple paths in one request)
 # ---------------------------------------------------------------------------
 script = """\
 import json
@@ -46,8 +46,13 @@ import json
 data = {"name": "GravixLayer", "version": "1.0"}
 print(json.dumps(data))
 """
-runtime.file.write("/home/user/project/src/main.py", script)
-print("Wrote      : /home/user/project/src/main.py")
+entries = [
+    WriteEntry(path="/home/user/project/src/main.py", data=script),
+    WriteEntry(path="/home/user/project/README.md", data="# My Project\n\nA sample project."),
+    WriteEntry(path="/home/user/project/run.sh", data="#!/bin/bash\npython src/main.py", mode=0o755),
+]
+batch_result = runtime.file.write_many(entries)
+print(f"Batch write: {len(batch_result.files)} file(s)")
 
 # ---------------------------------------------------------------------------
 # 4. List a directory
@@ -70,17 +75,7 @@ uploaded = runtime.file.upload(
 print(f"\nUpload     : wrote {uploaded.path} ({uploaded.name})")
 
 # ---------------------------------------------------------------------------
-# 6. Batch multipart write (multiple paths in one request)
-# ---------------------------------------------------------------------------
-entries = [
-    WriteEntry(path="/home/user/project/README.md", data="# My Project\n\nA sample project."),
-    WriteEntry(path="/home/user/project/run.sh", data="#!/bin/bash\npython src/main.py", mode=0o755),
-]
-batch_result = runtime.file.write_many(entries)
-print(f"Batch write: {len(batch_result.files)} file(s)")
-
-# ---------------------------------------------------------------------------
-# 7–8. Stat + chmod (same path as step 5 so the file is known to exist)
+# 6–7. Stat + chmod (same path as step 5 so the file is known to exist)
 # ---------------------------------------------------------------------------
 STAT_PATH = "/home/user/project/config.json"
 info_run = runtime.file.get_info(STAT_PATH)
@@ -105,7 +100,7 @@ if info_after.exists and info_after.info:
     )
 
 # ---------------------------------------------------------------------------
-# 9. List project tree
+# 8. List project tree
 # ---------------------------------------------------------------------------
 file_list = runtime.file.list("/home/user/project")
 print("\nFiles in /home/user/project:")
@@ -114,7 +109,7 @@ for f in file_list.files:
     print(f"  {kind}{f.name}")
 
 # ---------------------------------------------------------------------------
-# 10. Upload from bytes (e.g. local file: open(..., "rb") as fh)
+# 9. Upload from bytes (e.g. local file: open(..., "rb") as fh)
 # ---------------------------------------------------------------------------
 up = runtime.file.upload_file(
     BytesIO(b"uploaded from laptop\n"), path="/home/user/from_local.txt"
@@ -122,14 +117,14 @@ up = runtime.file.upload_file(
 print(f"\nLocal file : uploaded to {up.path!r} ({up.message})")
 
 # ---------------------------------------------------------------------------
-# 11. Download bytes from the runtime
+# 10. Download bytes from the runtime
 # ---------------------------------------------------------------------------
 downloaded = runtime.file.download_file("/home/user/hello.txt")
 print(f"\nDownloaded : {len(downloaded)} bytes from /home/user/hello.txt")
 print(f"Preview    : {downloaded.decode('utf-8').splitlines()[0]!r}")
 
 # ---------------------------------------------------------------------------
-# 12. Delete a file
+# 11. Delete a file
 # ---------------------------------------------------------------------------
 runtime.file.delete("/home/user/hello.txt")
 print("\nDeleted    : /home/user/hello.txt")
@@ -7,6 +7,9 @@ agent runtime. Useful for monitoring resource usage during heavy workloads.
 Usage:
     export GRAVIXLAYER_API_KEY="your-api-key"
     python examples/runtimes/09_runtime_metrics.py
+
+Set GRAVIXLAYER_LOAD_ITERATIONS to shrink or grow the CPU workload
+(default 10,000,000 iterations).
 """
 
 import os
@@ -17,6 +20,7 @@ from gravixlayer import GravixLayer
 client = GravixLayer()
 
 TEMPLATE = os.getenv("GRAVIXLAYER_TEMPLATE", "base-small")
+LOAD_ITERATIONS = int(os.getenv("GRAVIXLAYER_LOAD_ITERATIONS", "10000000"))
 
 runtime = client.runtime.create(template=TEMPLATE)
 sid = runtime.runtime_id
@@ -40,13 +44,19 @@ print(f"Timestamp  : {metrics.timestamp}")
 # 2. Generate some CPU load, then check metrics again
 # ---------------------------------------------------------------------------
 runtime.run_code(
-    code="sum(i * i for i in range(10_000_000))",
+    code=f"sum(i * i for i in range({LOAD_ITERATIONS}))",
 )
 
-# Small delay so metrics reflect the workload
-time.sleep(1)
-
+# Poll until a sample newer than the baseline is available (bounded), rather
+# than sleeping a fixed interval and hoping the metrics have refreshed.
+baseline_ts = metrics.timestamp
+deadline = time.monotonic() + 5.0
+delay = 0.1
 metrics = client.runtime.get_metrics(sid)
+while metrics.timestamp == baseline_ts and time.monotonic() + delay < deadline:
+    time.sleep(delay)
+    delay = min(delay * 2, 1.0)
+    metrics = client.runtime.get_metrics(sid)
 
 print("\n--- After CPU workload ---")
 print(f"CPU Usage  : {metrics.cpu_usage:.1f}%")
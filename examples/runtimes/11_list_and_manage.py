@@ -4,7 +4,7 @@ List and Manage Agent Runtimes
 
 Demonstrates how to:
   - List available templates
-  - List all active (running) agent runtimes with pagination
+  - List all active (running) agent runtimes, page by page
   - Get details of a specific agent runtime
 
 Useful for building dashboards, cleanup scripts, or inventory tools.
@@ -14,35 +14,66 @@ Usage:
     python examples/runtimes/11_list_and_manage.py
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from gravixlayer import GravixLayer
 
 client = GravixLayer()
 
+PAGE_SIZE = 20
+
+
+def iter_runtimes(first_page):
+    """Yield every runtime, fetching further pages only as they are needed."""
+    page, offset = first_page, 0
+    while True:
+        yield from page.runtimes
+        # A short (or empty) page is the last one. ``total`` is not used: it
+        # falls back to the page length when the API omits it.
+        if len(page.runtimes) < PAGE_SIZE:
+            return
+        offset += PAGE_SIZE
+        page = client.runtime.list(limit=PAGE_SIZE, offset=offset)
+
+
+# The template listing and the first runtime page are independent, so fetch
+# them concurrently over the client's shared connection pool.
+with ThreadPoolExecutor(max_workers=2) as pool:
+    templates_future = pool.submit(client.templates.list)
+    runtimes_future = pool.submit(client.runtime.list, limit=PAGE_SIZE, offset=0)
+
 # ---------------------------------------------------------------------------
 # 1. List available templates
 # ---------------------------------------------------------------------------
 print("--- Available Templates ---")
-templates = client.templates.list()
-for t in templates.templates:
-    print(f"  {t.name:<25s} {t.vcpu_count} vCPU | {t.memory_mb} MB | {t.description}")
+templates = templates_future.result()
+sys.stdout.write(
+    "".join(
+        f"  {t.name:<25s} {t.vcpu_count} vCPU | {t.memory_mb} MB | {t.description}\n"
+        for t in templates.templates
+    )
+)
 
 # ---------------------------------------------------------------------------
 # 2. List all running runtimes
 # ---------------------------------------------------------------------------
 print("\n--- Active Agent Runtimes ---")
-result = client.runtime.list(limit=50, offset=0)
-print(f"Total      : {result.total}")
+first_page = runtimes_future.result()
+print(f"Total      : {first_page.total}")
 
-if not result.runtimes:
+first = None
+for sb in iter_runtimes(first_page):
+    if first is None:
+        first = sb
+    print(f"  {sb.runtime_id}  status={sb.status:<10s}  template={sb.template}")
+
+if first is None:
     print("  (no running agent runtimes)")
 else:
-    for sb in result.runtimes:
-        print(f"  {sb.runtime_id}  status={sb.status:<10s}  template={sb.template}")
-
     # -------------------------------------------------------------------
     # 3. Get details of the first runtime
     # -------------------------------------------------------------------
-    first = result.runtimes[0]
     info = client.runtime.get(first.runtime_id)
     print(f"\n--- Runtime Details ({first.runtime_id}) ---")
     print(f"Status     : {info.status}")
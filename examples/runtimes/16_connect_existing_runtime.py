@@ -32,7 +32,8 @@ print(f"Status     : {original.status}")
 # 2. Reconnect to it by ID — no need to know how it was originally created
 # ---------------------------------------------------------------------------
 print("\n--- Reconnecting by ID ---")
-rt = Runtime.connect(saved_id)
+# Passing client= reuses its connection pool; omit it in a fresh process.
+rt = Runtime.connect(saved_id, client=client)
 print(f"Runtime ID : {rt.runtime_id}")
 print(f"Status     : {rt.status}")
 
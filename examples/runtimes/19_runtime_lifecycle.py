@@ -18,16 +18,25 @@ State transitions:
 import os
 import time
 
+from gravixlayer import GravixLayer
 from gravixlayer.types.runtime import Runtime
 
 TEMPLATE = os.getenv("GRAVIXLAYER_TEMPLATE", "base-small")
 
+# One client for the whole script so status checks reuse its connection pool.
+client = GravixLayer()
 
-def check_status(rt: Runtime, expected: str) -> None:
-    from gravixlayer import GravixLayer
-    client = GravixLayer()
-    info = client.runtime.get(rt.runtime_id)
-    status = info.status
+
+def check_status(rt: Runtime, expected: str, timeout: float = 10.0) -> None:
+    """Poll with exponential backoff until the runtime reports *expected*."""
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
+        status = client.runtime.get(rt.runtime_id).status
+        if status == expected or time.monotonic() + delay > deadline:
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
     ok = "[OK]" if status == expected else "[MISMATCH]"
     print(f"  status={status!r}  (expected {expected!r}) {ok}")
 
@@ -36,7 +45,7 @@ def check_status(rt: Runtime, expected: str) -> None:
 # 1. Create
 # ---------------------------------------------------------------------------
 print("=== 1. Create ===")
-rt = Runtime.create(template=TEMPLATE, timeout=1800)
+rt = Runtime.create(template=TEMPLATE, timeout=1800, client=client)
 print(f"  runtime_id={rt.runtime_id}")
 check_status(rt, "running")
 
@@ -52,7 +61,6 @@ print(f"  output: {result.stdout.strip()}")
 # ---------------------------------------------------------------------------
 print("\n=== 3. Pause ===")
 rt.pause()
-time.sleep(1)  # allow state propagation
 check_status(rt, "paused")
 
 # ---------------------------------------------------------------------------
@@ -60,7 +68,6 @@ check_status(rt, "paused")
 # ---------------------------------------------------------------------------
 print("\n=== 4. Resume ===")
 rt.resume()
-time.sleep(1)  # allow state propagation
 check_status(rt, "running")
 
 # ---------------------------------------------------------------------------
@@ -7,7 +7,6 @@ Usage:
 """
 
 import os
-import time
 
 from gravixlayer.types.runtime import Runtime
 
@@ -15,6 +14,15 @@ TEMPLATE = os.getenv("GRAVIXLAYER_TEMPLATE", "base-small")
 APP_DIR = "/home/user/app"
 PORT = 8000
 
+# Wait for the port inside the runtime so readiness costs one run_cmd
+# round trip instead of one per probe.
+WAIT_FOR_PORT = (
+    "for _ in $(seq 60); do "
+    f"python -c \"import socket; socket.create_connection(('127.0.0.1', {PORT}), 1).close()\" "
+    "2>/dev/null && exit 0; sleep 0.5; "
+    "done; exit 1"
+)
+
 APP_CODE = """\
 from fastapi import FastAPI
 
@@ -52,17 +60,8 @@ def main() -> None:
             working_dir=APP_DIR,
         )
 
-        for _ in range(30):
-            ready = rt.run_cmd(
-                command=(
-                    "python -c "
-                    f"\"import socket; s=socket.create_connection(('127.0.0.1',{PORT}),2); s.close()\""
-                )
-            )
-            if ready.exit_code == 0:
-                break
-            time.sleep(1)
-        else:
+        ready = rt.run_cmd(command=WAIT_FOR_PORT, timeout=60)
+        if ready.exit_code != 0:
             logs = rt.run_cmd(command="tail -n 50 /tmp/uvicorn.log")
             raise RuntimeError(f"uvicorn not ready:\n{logs.stdout}\n{logs.stderr}")
 
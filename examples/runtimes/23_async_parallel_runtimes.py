@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Run several runtimes in parallel with ``AsyncGravixLayer`` and ``asyncio.gather``.
+
+Each task creates a runtime, runs a snippet, and kills the runtime in a
+``finally`` block. The tasks share one async client (one connection pool),
+so total wall time is roughly one runtime lifecycle instead of the sum.
+
+    export GRAVIXLAYER_API_KEY=...
+    python examples/runtimes/23_async_parallel_runtimes.py
+"""
+
+import asyncio
+import os
+
+from gravixlayer import AsyncGravixLayer
+
+TEMPLATE = os.getenv("GRAVIXLAYER_TEMPLATE", "base-small")
+
+SNIPPETS = {
+    "squares": "print(sum(i * i for i in range(1000)))",
+    "version": "import platform; print(platform.python_version())",
+    "primes": "print([n for n in range(2, 30) if all(n % d for d in range(2, n))])",
+}
+
+
+async def run_one(client: AsyncGravixLayer, name: str, code: str) -> str:
+    runtime = await client.runtime.create(template=TEMPLATE)
+    try:
+        result = await client.runtime.run_code(runtime.runtime_id, code=code)
+        return f"{name:<8s} {runtime.runtime_id}  {result.text.strip()}"
+    finally:
+        await client.runtime.kill(runtime.runtime_id)
+
+
+async def main() -> None:
+    async with AsyncGravixLayer() as client:
+        # return_exceptions=True lets every task reach its finally/kill before
+        # the client closes, even if one of them fails.
+        results = await asyncio.gather(
+            *(run_one(client, name, code) for name, code in SNIPPETS.items()),
+            return_exceptions=True,
+        )
+
+    for name, outcome in zip(SNIPPETS, results):
+        print(f"{name:<8s} FAILED: {outcome}" if isinstance(outcome, Exception) else outcome)
+    print("\nAll runtimes terminated.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
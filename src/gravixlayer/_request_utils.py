@@ -1,9 +1,18 @@
+import math
 from typing import Any, Callable, Dict, Optional
 
+try:  # Optional fast JSON encoder (pip install "gravixlayer[speedups]").
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 RETRYABLE_STATUS = frozenset((502, 503, 504))
 SUCCESS_STATUS = frozenset((200, 201, 202, 204, 207))
 JSON_HEADERS = {"Content-Type": "application/json"}
 _ABSOLUTE_URL_PREFIXES = ("http://", "https://")
+# orjson rejects integers outside the 64-bit range that the stdlib accepts.
+_ORJSON_INT_MIN = -(1 << 63)
+_ORJSON_INT_MAX = (1 << 64) - 1
 
 
 def build_url(
@@ -29,11 +38,47 @@ def build_url(
     return f"{service_base}/{endpoint.lstrip('/')}"
 
 
+def _fits_orjson_int(value: int) -> bool:
+    return _ORJSON_INT_MIN <= value <= _ORJSON_INT_MAX
+
+
+def _encodes_identically(value: Any) -> bool:
+    """Return True if orjson and the stdlib json encoder agree on *value*.
+
+    Only plain JSON types qualify: exact ``dict``/``list``/``tuple``/``str``/
+    ``int``/``bool``/``None`` and finite ``float``. Anything else (NaN,
+    datetimes, UUIDs, dataclasses, subclasses) is left to the stdlib path so
+    that installing orjson never changes what is sent or what raises.
+    """
+    kind = type(value)
+    if kind is str or kind is bool or value is None:
+        return True
+    if kind is int:
+        return _fits_orjson_int(value)
+    if kind is float:
+        return math.isfinite(value)
+    if kind is dict:
+        return all(
+            (type(k) is str or (type(k) is int and _fits_orjson_int(k)))
+            and _encodes_identically(v)
+            for k, v in value.items()
+        )
+    if kind is list or kind is tuple:
+        return all(_encodes_identically(v) for v in value)
+    return False
+
+
 def prepare_request_kwargs(
     data: Optional[Dict[str, Any]],
     kwargs: Dict[str, Any],
 ) -> None:
-    """Mutate kwargs in place for JSON or multipart requests."""
+    """Mutate kwargs in place for JSON or multipart requests.
+
+    JSON bodies are pre-encoded with ``orjson`` when it is installed and
+    handed to httpx as raw ``content``; otherwise httpx encodes ``json=``.
+    Payloads the two encoders would treat differently (e.g. NaN, datetimes)
+    always take the ``json=`` path, so the result does not depend on orjson.
+    """
     has_files = "files" in kwargs
     if has_files:
         if data is not None:
@@ -41,7 +86,10 @@ def prepare_request_kwargs(
         return
 
     if data is not None:
-        kwargs["json"] = data
+        if orjson and _encodes_identically(data):
+            kwargs["content"] = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            kwargs["json"] = data
     kwargs["headers"] = JSON_HEADERS
 
 
@@ -3,6 +3,10 @@ from urllib.parse import urlencode
 
 T = TypeVar("T")
 
+POLL_INITIAL_INTERVAL_SECS = 1.0
+POLL_BACKOFF_FACTOR = 1.5
+POLL_JITTER = 0.2
+
 
 def normalize_runtime_api_payload(data: Dict[str, Any]) -> None:
     """Map Gravix Layer API JSON keys to SDK ``Runtime`` field names.
@@ -68,3 +72,17 @@ def parse_paginated_items(
         payload.get("limit", default_limit),
         payload.get("offset", default_offset),
     )
+
+
+def next_poll_interval(current: float, ceiling: float) -> float:
+    """Grow a status-poll interval geometrically, capped at *ceiling*."""
+    return min(current * POLL_BACKOFF_FACTOR, ceiling)
+
+
+def jittered_poll_delay(interval: float, rand: Callable[[], float]) -> float:
+    """Shorten *interval* by up to POLL_JITTER so concurrent pollers do not align.
+
+    Jitter is downward only, so the result never exceeds *interval* and a
+    capped interval keeps its full spread.
+    """
+    return interval * (1.0 - POLL_JITTER * rand())
@@ -7,12 +7,19 @@ deleting VM templates via the Gravix Layer API. Mirrors the sync Templates class
 
 import asyncio
 import logging
+import random
 import sys
 import time as _time
 from typing import Dict, Any, Optional, Union
 
 from .._cli_progress import TEMPLATE_BUILD_PHASE_LABELS, PhaseSpinner, fmt_duration
-from .._resource_utils import build_list_endpoint, parse_paginated_items
+from .._resource_utils import (
+    POLL_INITIAL_INTERVAL_SECS,
+    build_list_endpoint,
+    jittered_poll_delay,
+    next_poll_interval,
+    parse_paginated_items,
+)
 from ..types.templates import (
     TemplateBuilder,
     TemplateBuildResponse,
@@ -148,7 +155,10 @@ class AsyncTemplates:
 
         Args:
             builder: A TemplateBuilder or raw dict for the build request.
-            poll_interval_secs: Seconds between status polls (default 5).
+            poll_interval_secs: Maximum seconds between status polls (default 5).
+                Polling starts at 1s and backs off to this ceiling, with each
+                sleep randomly shortened by up to 20%, so short builds are
+                noticed quickly without hammering long ones.
             timeout_secs: Maximum seconds to wait (default 600).
             on_status: Optional callback on each **phase change** (not every poll).
 
@@ -176,6 +186,7 @@ class AsyncTemplates:
             ))
 
         deadline = _time.monotonic() + timeout_secs
+        interval = min(POLL_INITIAL_INTERVAL_SECS, poll_interval_secs)
         last_phase_raw = ""
         last_display_label = ""
         phase_start = _time.monotonic()
@@ -269,7 +280,9 @@ class AsyncTemplates:
                 phase_start = now
                 last_display_label = current_display
 
-            await asyncio.sleep(poll_interval_secs)
+            delay = jittered_poll_delay(interval, random.random)
+            await asyncio.sleep(min(delay, max(deadline - _time.monotonic(), 0.0)))
+            interval = next_poll_interval(interval, poll_interval_secs)
 
     # -- Template CRUD ------------------------------------------------------
 
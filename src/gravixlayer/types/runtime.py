@@ -1102,6 +1102,19 @@ class RuntimeKillResponse:
     runtime_id: Optional[str] = None
 
 
+def _split_output_lines(text: Optional[str]) -> List[str]:
+    r"""Split command output on ``\n`` only, dropping the empty tail after a final newline.
+
+    ``\r`` (pip/curl/apt progress) and other separators are kept inside lines.
+    """
+    if not text:
+        return []
+    lines = text.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
 class Execution:
     """Unified result wrapper for code or command execution.
 
@@ -1126,12 +1139,10 @@ class Execution:
                 "stderr": list(resp.logs.stderr),
             }
         cmd_resp: CommandRunResponse = self._response
-        result: Dict[str, List[str]] = {"stdout": [], "stderr": []}
-        if cmd_resp.stdout:
-            result["stdout"] = cmd_resp.stdout.split("\n")
-        if cmd_resp.stderr:
-            result["stderr"] = cmd_resp.stderr.split("\n")
-        return result
+        return {
+            "stdout": _split_output_lines(cmd_resp.stdout),
+            "stderr": _split_output_lines(cmd_resp.stderr),
+        }
 
     @property
     def stdout(self) -> str:
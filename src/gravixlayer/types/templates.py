@@ -411,10 +411,20 @@ class TemplateBuilder:
         return self
 
     def apt_install(self, *packages: str) -> "TemplateBuilder":
-        """Install system packages via apt-get."""
+        """Install system packages via apt-get.
+
+        Back-to-back calls are merged into one step so the build pays for a
+        single ``apt-get update``; calls separated by other steps keep their
+        order and stay separate.
+        """
         if not packages:
             raise ValueError("At least one package name is required")
-        self._build_steps.append(BuildStep(type="apt_install", args=list(packages)))
+        steps = self._build_steps
+        if steps and steps[-1].type == "apt_install":
+            existing = steps[-1].args
+            existing.extend(p for p in packages if p not in existing)
+        else:
+            steps.append(BuildStep(type="apt_install", args=list(packages)))
         return self
 
     def bun_install(self, *packages: str) -> "TemplateBuilder":
@@ -494,8 +504,11 @@ class TemplateBuilder:
     ) -> "TemplateBuilder":
         """Copy an entire local directory into the template VM.
 
-        Recursively walks *src* and copies every file, preserving the
-        relative directory structure under *dest*.
+        Recursively walks *src* once and copies every file, preserving the
+        relative directory structure under *dest*. Files are added in sorted
+        order so the same tree always yields the same build steps; anything
+        that is not a regular file (FIFOs, sockets, dangling symlinks) is
+        skipped.
 
         Args:
             src:  Path to the local directory.
@@ -518,12 +531,18 @@ class TemplateBuilder:
         if not os.path.isdir(src_abs):
             raise NotADirectoryError(f"Path is not a directory: {src_abs}")
 
-        for dirpath, _dirnames, filenames in os.walk(src_abs):
-            for filename in filenames:
+        # os.walk lists FIFOs, sockets and dangling symlinks under filenames;
+        # opening a FIFO would block, so only regular files are copied.
+        for dirpath, dirnames, filenames in os.walk(src_abs):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, src_abs)
+            for filename in sorted(filenames):
                 local_path = os.path.join(dirpath, filename)
-                relative = os.path.relpath(local_path, src_abs)
+                if not os.path.isfile(local_path):
+                    continue
+                relative = filename if rel_dir == os.curdir else os.path.join(rel_dir, filename)
                 vm_path = os.path.join(dest, relative).replace("\\", "/")
-                self.copy_file(local_path, vm_path, mode=mode, user=user)
+                self.copy_file(Path(local_path), vm_path, mode=mode, user=user)
         return self
 
     def git_clone(
@@ -533,6 +552,7 @@ class TemplateBuilder:
         branch: Optional[str] = None,
         depth: Optional[int] = None,
         auth_token: Optional[str] = None,
+        sparse_paths: Optional[List[str]] = None,
     ) -> "TemplateBuilder":
         """Clone a git repository inside the VM.
 
@@ -542,7 +562,35 @@ class TemplateBuilder:
             branch: Branch to clone (optional).
             depth: Clone depth for shallow clone (optional).
             auth_token: HTTPS auth token for private repos (optional).
+            sparse_paths: Check out only these directories (optional). Emits a
+                blob-less sparse ``git clone`` run step instead, so only the
+                listed paths are downloaded. Requires ``git`` >= 2.25 in the
+                image and *dest*; cannot be combined with *auth_token*.
+
+        Raises:
+            ValueError: If *sparse_paths* is given without *dest* or with
+                *auth_token*.
         """
+        if sparse_paths:
+            if not dest:
+                raise ValueError("dest is required when sparse_paths is set")
+            if auth_token:
+                raise ValueError(
+                    "sparse_paths cannot be combined with auth_token; the sparse clone runs "
+                    "as a shell command and would expose the token in build logs"
+                )
+            clone = ["git", "clone", "--filter=blob:none", "--sparse"]
+            if depth is not None:
+                clone += ["--depth", str(depth)]
+            if branch:
+                clone += ["--branch", branch]
+            clone += [url, dest]
+            checkout = ["git", "-C", dest, "sparse-checkout", "set", *sparse_paths]
+            return self.run(
+                f"{shlex.join(clone)} && git -C {shlex.quote(dest)} sparse-checkout init --cone"
+                f" && {shlex.join(checkout)}"
+            )
+
         args = [url]
         if dest:
             args.append(dest)
@@ -1,5 +1,14 @@
 """Unit tests for gravixlayer._request_utils."""
 
+import json
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from gravixlayer import _request_utils
 from gravixlayer._request_utils import (
     RETRYABLE_STATUS,
     SUCCESS_STATUS,
@@ -76,16 +85,71 @@ class TestBuildUrl:
 
 
 class TestPrepareRequestKwargs:
-    def test_json_body_sets_headers(self):
+    def test_json_body_sets_headers(self, monkeypatch):
+        monkeypatch.setattr(_request_utils, "orjson", None)
         kwargs: dict = {}
         prepare_request_kwargs({"a": 1}, kwargs)
         assert kwargs["json"] == {"a": 1}
         assert kwargs["headers"] == JSON_HEADERS
 
+    def test_json_body_pre_encoded_with_orjson(self):
+        if _request_utils.orjson is None:
+            pytest.skip("orjson not installed")
+        kwargs: dict = {}
+        prepare_request_kwargs({"a": 1, 2: "b"}, kwargs)
+        assert "json" not in kwargs
+        assert json.loads(kwargs["content"]) == {"a": 1, "2": "b"}
+        assert kwargs["headers"] == JSON_HEADERS
+
+    def test_json_body_uses_orjson_module_when_present(self, monkeypatch):
+        calls = []
+
+        def dumps(data, option=None):
+            calls.append((data, option))
+            return b"encoded"
+
+        stub = SimpleNamespace(OPT_NON_STR_KEYS=4, dumps=dumps)
+        monkeypatch.setattr(_request_utils, "orjson", stub)
+        kwargs: dict = {}
+        prepare_request_kwargs({"a": 1}, kwargs)
+        assert calls == [({"a": 1}, 4)]
+        assert kwargs["content"] == b"encoded"
+        assert "json" not in kwargs
+        assert kwargs["headers"] == JSON_HEADERS
+
+    @pytest.mark.parametrize("with_orjson", [True, False])
+    def test_nan_rejected_with_and_without_orjson(self, monkeypatch, with_orjson):
+        stub = SimpleNamespace(OPT_NON_STR_KEYS=4, dumps=lambda data, option=None: b"null")
+        monkeypatch.setattr(_request_utils, "orjson", stub if with_orjson else None)
+        kwargs: dict = {}
+        prepare_request_kwargs({"score": float("nan")}, kwargs)
+        assert "content" not in kwargs
+        with pytest.raises(ValueError):
+            httpx.Request("POST", "https://example.test", **kwargs)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"at": datetime(2024, 1, 1)},
+            {"ratio": float("inf")},
+            {"items": [1, {"nested": float("-inf")}]},
+            {"id": uuid.uuid4()},
+            {"big": 1 << 70},
+        ],
+    )
+    def test_payloads_orjson_would_change_use_stdlib_path(self, monkeypatch, payload):
+        stub = SimpleNamespace(OPT_NON_STR_KEYS=4, dumps=lambda data, option=None: b"{}")
+        monkeypatch.setattr(_request_utils, "orjson", stub)
+        kwargs: dict = {}
+        prepare_request_kwargs(payload, kwargs)
+        assert kwargs["json"] is payload
+        assert "content" not in kwargs
+
     def test_none_data_only_headers(self):
         kwargs: dict = {}
         prepare_request_kwargs(None, kwargs)
         assert "json" not in kwargs
+        assert "content" not in kwargs
         assert kwargs["headers"] == JSON_HEADERS
 
     def test_files_with_data_puts_form_data(self):
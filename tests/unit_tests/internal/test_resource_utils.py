@@ -1,10 +1,14 @@
 """Unit tests for gravixlayer._resource_utils."""
 
+import pytest
+
 from gravixlayer._resource_utils import (
     normalize_runtime_api_payload,
     build_list_endpoint,
     parse_total_items,
     parse_paginated_items,
+    next_poll_interval,
+    jittered_poll_delay,
 )
 
 
@@ -104,3 +108,23 @@ class TestParsePaginatedItems:
         assert items == []
         assert limit == 5
         assert offset == 10
+
+
+class TestNextPollInterval:
+    def test_grows_geometrically(self):
+        assert next_poll_interval(1.0, 10.0) == 1.5
+        assert next_poll_interval(1.5, 10.0) == 2.25
+
+    def test_capped_at_ceiling(self):
+        assert next_poll_interval(4.0, 5.0) == 5.0
+        assert next_poll_interval(5.0, 5.0) == 5.0
+
+
+class TestJitteredPollDelay:
+    def test_bounds(self):
+        assert jittered_poll_delay(5.0, lambda: 0.0) == 5.0
+        assert jittered_poll_delay(5.0, lambda: 1.0) == pytest.approx(4.0)
+
+    def test_never_exceeds_interval(self):
+        for r in (0.0, 0.25, 0.5, 0.75, 1.0):
+            assert jittered_poll_delay(2.0, lambda: r) <= 2.0
@@ -7,9 +7,11 @@ build_and_wait polling, error/timeout handling, edge cases, API
 field alignment, import verification.
 """
 
+import asyncio
 import base64
 import json
 import os
+import random
 import time
 import tempfile
 import pytest
@@ -277,6 +279,20 @@ class TestTemplateBuilder:
         d = TemplateBuilder("t").apt_install("git", "curl").to_dict()
         assert d["build_steps"][0]["type"] == "apt_install"
 
+    def test_consecutive_apt_installs_merge(self):
+        d = (
+            TemplateBuilder("t")
+            .apt_install("git", "curl")
+            .apt_install("curl", "jq")
+            .run("echo hi")
+            .apt_install("vim")
+            .to_dict()
+        )
+        steps = d["build_steps"]
+        assert [s["type"] for s in steps] == ["apt_install", "run", "apt_install"]
+        assert steps[0]["args"] == ["git", "curl", "jq"]
+        assert steps[2]["args"] == ["vim"]
+
     def test_apt_install_empty_raises(self):
         with pytest.raises(ValueError):
             TemplateBuilder("t").apt_install()
@@ -332,6 +348,30 @@ class TestTemplateBuilder:
             assert "/app/a.py" in paths
             assert "/app/sub/b.py" in paths
 
+    def test_copy_dir_is_sorted_and_skips_dangling_symlinks(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.makedirs(os.path.join(tmpdir, "b"))
+            for name in ("z.py", "a.py", os.path.join("b", "c.py")):
+                with open(os.path.join(tmpdir, name), "w") as f:
+                    f.write(name)
+            os.symlink(os.path.join(tmpdir, "missing"), os.path.join(tmpdir, "broken"))
+
+            d = TemplateBuilder("t").copy_dir(tmpdir, "/app", mode="0644").to_dict()
+            steps = d["build_steps"]
+            assert [s["args"][0] for s in steps] == ["/app/a.py", "/app/z.py", "/app/b/c.py"]
+            assert all(s["options"] == {"mode": "0644"} for s in steps)
+            assert base64.b64decode(steps[0]["content"]) == b"a.py"
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+    def test_copy_dir_skips_fifos(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "a.py"), "w") as f:
+                f.write("a")
+            os.mkfifo(os.path.join(tmpdir, "pipe"))
+
+            d = TemplateBuilder("t").copy_dir(tmpdir, "/app").to_dict()
+            assert [s["args"][0] for s in d["build_steps"]] == ["/app/a.py"]
+
     def test_copy_dir_not_found(self):
         with pytest.raises(FileNotFoundError):
             TemplateBuilder("t").copy_dir("/nonexistent", "/app")
@@ -354,6 +394,30 @@ class TestTemplateBuilder:
         assert step["options"]["branch"] == "main"
         assert step["options"]["depth"] == "1"
 
+    def test_git_clone_sparse_emits_run_step(self):
+        d = TemplateBuilder("t").git_clone(
+            "https://github.com/user/mono",
+            dest="/app",
+            branch="main",
+            depth=1,
+            sparse_paths=["services/api", "libs/common"],
+        ).to_dict()
+        step = d["build_steps"][0]
+        assert step["type"] == "run"
+        assert step["args"] == [
+            "git clone --filter=blob:none --sparse --depth 1 --branch main https://github.com/user/mono /app"
+            " && git -C /app sparse-checkout init --cone"
+            " && git -C /app sparse-checkout set services/api libs/common"
+        ]
+
+    def test_git_clone_sparse_requires_dest_and_rejects_token(self):
+        with pytest.raises(ValueError, match="dest"):
+            TemplateBuilder("t").git_clone("https://github.com/u/r", sparse_paths=["a"])
+        with pytest.raises(ValueError, match="auth_token"):
+            TemplateBuilder("t").git_clone(
+                "https://github.com/u/r", dest="/app", auth_token="tok", sparse_paths=["a"]
+            )
+
     def test_mkdir_step(self):
         d = TemplateBuilder("t").mkdir("/app/data", mode="0755").to_dict()
         step = d["build_steps"][0]
@@ -540,6 +604,33 @@ class TestSyncBuildAndWait:
                 timeout_secs=0,  # immediate timeout
             )
 
+    @pytest.mark.parametrize(
+        "rand, expected",
+        [
+            (0.0, [1.0, 1.5, 2.0, 2.0]),  # no jitter
+            (1.0, [0.8, 1.2, 1.6, 1.6]),  # maximum (downward) jitter
+        ],
+    )
+    def test_build_and_wait_backs_off_to_poll_interval(
+        self, client, mock_api, monkeypatch, rand, expected
+    ):
+        mock_api.post(f"{TMPL_BASE}/build").mock(
+            return_value=httpx.Response(202, json=make_build_response())
+        )
+        mock_api.get(f"{TMPL_BASE}/builds/build-001/status").mock(
+            side_effect=[httpx.Response(200, json=make_build_status("running"))] * 4
+            + [httpx.Response(200, json=make_build_status("completed"))]
+        )
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        monkeypatch.setattr(random, "random", lambda: rand)
+        status = client.templates.build_and_wait(
+            TemplateBuilder("test").from_image("python:3.11"),
+            poll_interval_secs=2.0,
+        )
+        assert status.is_success is True
+        assert sleeps == pytest.approx(expected)
+
     def test_build_and_wait_with_callback(self, client, mock_api):
         mock_api.post(f"{TMPL_BASE}/build").mock(
             return_value=httpx.Response(202, json=make_build_response())
@@ -667,6 +758,30 @@ class TestAsyncTemplatesResource:
             )
             assert status.is_success is True
 
+    @pytest.mark.asyncio
+    async def test_build_and_wait_backs_off_to_poll_interval(self, mock_api, monkeypatch):
+        mock_api.post(f"{TMPL_BASE}/build").mock(
+            return_value=httpx.Response(202, json=make_build_response())
+        )
+        mock_api.get(f"{TMPL_BASE}/builds/build-001/status").mock(
+            side_effect=[httpx.Response(200, json=make_build_status("running"))] * 4
+            + [httpx.Response(200, json=make_build_status("completed"))]
+        )
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        monkeypatch.setattr(random, "random", lambda: 0.0)  # no jitter
+        async with AsyncGravixLayer(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as client:
+            status = await client.templates.build_and_wait(
+                TemplateBuilder("test").from_image("python:3.11"),
+                poll_interval_secs=2.0,
+            )
+            assert status.is_success is True
+        assert sleeps == pytest.approx([1.0, 1.5, 2.0, 2.0])
+
     @pytest.mark.asyncio
     async def test_build_and_wait_with_callback(self, mock_api):
         mock_api.post(f"{TMPL_BASE}/build").mock(
@@ -426,6 +426,25 @@ class TestExecution:
         assert "line1" in logs["stdout"]
         assert "line2" in logs["stdout"]
 
+    def test_logs_dict_for_command_trailing_newline(self):
+        cmd_resp = CommandRunResponse(
+            stdout="line1\nline2\n", stderr="", exit_code=0,
+            duration_ms=10, success=True,
+        )
+        logs = Execution(cmd_resp).logs
+        assert logs["stdout"] == ["line1", "line2"]
+        assert logs["stderr"] == []
+
+    def test_logs_dict_for_command_keeps_carriage_returns(self):
+        stdout = "Downloading 10%\rDownloading 100%\ndone\n"
+        cmd_resp = CommandRunResponse(
+            stdout=stdout, stderr="", exit_code=0,
+            duration_ms=10, success=True,
+        )
+        logs = Execution(cmd_resp).logs
+        assert logs["stdout"] == ["Downloading 10%\rDownloading 100%", "done"]
+        assert "\n".join(logs["stdout"]) + "\n" == stdout
+
 
 # ===================================================================
 # CodeRunResponse